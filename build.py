@@ -1,66 +1,126 @@
 import os
+import argparse
+import hashlib
 import platform
+import shutil
 import subprocess
 import sys
 from PyInstaller.__main__ import run as pyinstaller_run
 
+# Marker recording which package metadata the dev install was done for
+DEV_INSTALL_STAMP = os.path.join("build", ".dev-install.stamp")
+
+# Set to a non-empty value to zip the bundle into a single release artifact
+RELEASE_ENV_VAR = "VIDEO_ANALYZER_RELEASE"
+
 def run_command(command):
-    """Run a command and return its output."""
+    """Run a command given as an argument list and return its output."""
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(command, check=True, capture_output=True, text=True)
         print(result.stdout)
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error: {e.stderr}", file=sys.stderr)
         return False
+    except FileNotFoundError as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        return False
 
-def build_executable():
-    """Build the executable for the current platform."""
-    system = platform.system().lower()
+def _dev_install_key():
+    """Fingerprint the package metadata and interpreter used for the dev install."""
+    with open("pyproject.toml", "rb") as f:
+        metadata = f.read()
+    return hashlib.sha256(metadata + sys.executable.encode() + sys.version.encode()).hexdigest()
+
+def install_dev_dependencies(force=False):
+    """Install development dependencies unless the stamp shows they are current."""
+    key = _dev_install_key()
+    if not force:
+        try:
+            with open(DEV_INSTALL_STAMP, "r") as f:
+                if f.read().strip() == key:
+                    print("Development dependencies are up to date.")
+                    return True
+        except OSError:
+            pass
     
-    # Install development dependencies
     print("Installing development dependencies...")
-    if not run_command("pip install -e .[dev]"):
+    if not run_command([sys.executable, "-m", "pip", "install",
+                        "--disable-pip-version-check", "-e", ".[dev]"]):
         return False
+    
+    os.makedirs(os.path.dirname(DEV_INSTALL_STAMP), exist_ok=True)
+    with open(DEV_INSTALL_STAMP, "w") as f:
+        f.write(key)
+    return True
+
+def build_executable(fresh=False):
+    """Build the executable for the current platform.
+    
+    PyInstaller's build cache and the dev dependency install are reused
+    between runs unless fresh is True. The bundle is zipped into a single
+    archive when the VIDEO_ANALYZER_RELEASE environment variable is set.
+    """
+    system = platform.system().lower()
+    
+    if not install_dev_dependencies(fresh):
+        return False
+    
+    options, output_name = _pyinstaller_options(system, fresh)
+    
+    # Create dist directory if it doesn't exist
+    os.makedirs("dist", exist_ok=True)
 
     print(f"\nBuilding executable for {system}...")
     
+    try:
+        pyinstaller_run(options)
+        
+        print("\nBuild completed successfully!")
+        print("\nExecutable location:")
+        print(f"  dist/video-analyzer/{output_name}")
+        
+        if os.environ.get(RELEASE_ENV_VAR):
+            archive = shutil.make_archive(os.path.join("dist", "video-analyzer"), "zip",
+                                          os.path.join("dist", "video-analyzer"))
+            print("\nRelease archive:")
+            print(f"  {archive}")
+        
+        return True
+    except Exception as e:
+        print(f"\nError during build: {str(e)}", file=sys.stderr)
+        return False
+
+def _pyinstaller_options(system, fresh):
+    """Return the PyInstaller options and output name for a platform."""
     # Define PyInstaller options
     options = [
         'video_analyzer/__main__.py',  # Script to build
         '--name=video-analyzer',       # Output name
-        '--onefile',                   # Create single executable
-        '--clean',                     # Clean cache
+        '--onedir',                    # Keep a bundle directory so rebuilds reuse cached output
         '--noconsole',                # No console window (Windows only)
         '--add-data=README.md:.',     # Include README
         '--icon=NONE'                 # No icon for now
     ]
     
+    if fresh:
+        options.append('--clean')    # Discard cached analysis for a full rebuild
+    
     if system == "windows":
         options.append('--console')  # Show console on Windows
         output_name = "video-analyzer.exe"
-    elif system == "darwin":
-        output_name = "video-analyzer-macos"
     else:
         output_name = "video-analyzer"
     
-    try:
-        pyinstaller_run(options)
-        
-        # Create dist directory if it doesn't exist
-        os.makedirs("dist", exist_ok=True)
-        
-        print("\nBuild completed successfully!")
-        print("\nExecutable location:")
-        print(f"  dist/{output_name}")
-        
-        return True
-    except Exception as e:
-        print(f"\nError during build: {str(e)}", file=sys.stderr)
-        return False
+    return options, output_name
 
 if __name__ == "__main__":
-    if build_executable():
+    parser = argparse.ArgumentParser(description="Build the Video Analyzer executable")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Reinstall dependencies, clean PyInstaller's cache and rebuild from scratch")
+    args = parser.parse_args()
+    
+    if build_executable(fresh=args.fresh):
         print("\nYou can now distribute the executable from the 'dist' directory.")
     else:
         print("\nBuild failed. Please check the error messages above.", file=sys.stderr)
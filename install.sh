@@ -128,16 +128,16 @@ download_project() {
     echo -e "${CYAN}Setting up project directory...${NC}"
     
     # First check if we're already in the project directory
-    if [[ -f "$(pwd)/setup.py" ]]; then
-        log "INFO" "Found setup.py in current directory, using it as project source"
-        echo -e "${YELLOW}Found setup.py in current directory, using it as project source.${NC}"
+    if [[ -f "$(pwd)/pyproject.toml" || -f "$(pwd)/setup.py" ]]; then
+        log "INFO" "Found project metadata in current directory, using it as project source"
+        echo -e "${YELLOW}Found project metadata in current directory, using it as project source.${NC}"
         mkdir -p "$project_dir"
         cp -r "$(pwd)/"* "$project_dir/"
         return 0
     fi
     
     # Check if we already have the source code
-    if [[ -f "$project_dir/setup.py" ]]; then
+    if [[ -f "$project_dir/pyproject.toml" || -f "$project_dir/setup.py" ]]; then
         log "INFO" "Project directory already exists, using existing files"
         echo -e "${YELLOW}Project directory already exists, using existing files.${NC}"
         return 0
@@ -226,9 +226,9 @@ download_project() {
     fi
     
     # Check if we have a valid project
-    if [[ ! -f "$project_dir/setup.py" ]]; then
-        log "ERROR" "Invalid project directory, setup.py not found"
-        echo -e "${RED}Invalid project directory, setup.py not found.${NC}"
+    if [[ ! -f "$project_dir/pyproject.toml" && ! -f "$project_dir/setup.py" ]]; then
+        log "ERROR" "Invalid project directory, pyproject.toml not found"
+        echo -e "${RED}Invalid project directory, pyproject.toml not found.${NC}"
         create_minimal_setup "$project_dir"
         return 0
     fi
@@ -351,19 +351,24 @@ repair_installation() {
     # Fix rich package installation
     check_rich_package "$venv_dir"
     
-    # Check if we need to update setup.py (if it exists)
-    local setup_file="$install_dir/source/setup.py"
+    # Check if we need to update the project metadata (if it exists)
+    local setup_file="$install_dir/source/pyproject.toml"
+    local rich_pattern='s/"rich[^"]*"/"rich==12.6.0"/g'
+    if [[ ! -f "$setup_file" ]]; then
+        setup_file="$install_dir/source/setup.py"
+        rich_pattern='s/rich[><=][0-9."]*/rich==12.6.0/g'
+    fi
     if [[ -f "$setup_file" ]]; then
-        log "INFO" "Updating setup.py to include proper rich version"
-        echo -e "${CYAN}Updating setup.py to include proper rich version...${NC}"
-        
+        log "INFO" "Updating $(basename "$setup_file") to include proper rich version"
+        echo -e "${CYAN}Updating $(basename "$setup_file") to include proper rich version...${NC}"
+
         # Create a backup
         cp "$setup_file" "${setup_file}.bak"
-        
-        # Update the rich version in setup.py
-        sed -i 's/rich[><=][0-9."]*/rich==12.6.0/g' "$setup_file" || {
-            log "WARNING" "Failed to update setup.py, manually patching installation"
-            echo -e "${YELLOW}Failed to update setup.py, manually patching installation...${NC}"
+
+        # Update the rich version in the project metadata
+        sed -i "$rich_pattern" "$setup_file" || {
+            log "WARNING" "Failed to update $(basename "$setup_file"), manually patching installation"
+            echo -e "${YELLOW}Failed to update $(basename "$setup_file"), manually patching installation...${NC}"
         }
     fi
     
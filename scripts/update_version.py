@@ -10,46 +10,138 @@ to automatically increment the version on each commit.
 import os
 import sys
 import datetime
-import re
+import ast
 import argparse
 import subprocess
+import json
 
 # Path to the version file relative to the project root
 VERSION_FILE_PATH = "video_analyzer/version.py"
 
+# Directory for cached git metadata, keyed by HEAD commit
+GIT_INFO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "video_analyzer")
+
+# Module-level assignments in version.py managed by this script
+VERSION_FIELDS = {
+    "__version__": "version",
+    "__build__": "build",
+    "__release_date__": "release_date"
+}
+
+def _parse_branch(ref_names):
+    """Extract the checked-out branch name from a %D ref list."""
+    for ref in ref_names.split(", "):
+        if ref.startswith("HEAD -> "):
+            return ref[len("HEAD -> "):]
+    # Detached HEAD, same as `git rev-parse --abbrev-ref HEAD`
+    return "HEAD"
+
+def _git(*args):
+    """Run a one-shot git command and return its stripped output."""
+    return subprocess.check_output(["git", *args], universal_newlines=True).strip()
+
+def _query_git_info():
+    """Query commit metadata for HEAD."""
+    # Get commit hash, ref names and commit date in a single call,
+    # separated by the ASCII unit separator
+    commit_hash, ref_names, commit_date = _git(
+        "log", "-1", "--format=%H%x1f%D%x1f%ci", "HEAD"
+    ).split("\x1f")
+    
+    # Get commit count
+    commit_count = _git("rev-list", "--count", "HEAD")
+    
+    return {
+        "commit_hash": commit_hash,
+        "branch": _parse_branch(ref_names),
+        "commit_date": commit_date,
+        "commit_count": commit_count
+    }
+
+def _load_cached_git_info(cache_path, head_mtime):
+    """Load cached git metadata, or None if missing or stale."""
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # A moved ref (e.g. switching branch at the same commit) touches .git/HEAD
+    if cached.get("head_mtime_ns") != head_mtime:
+        return None
+    return cached.get("git_info")
+
+def _store_cached_git_info(cache_path, head_mtime, git_info):
+    """Write git metadata to the cache, ignoring failures."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            json.dump({"head_mtime_ns": head_mtime, "git_info": git_info}, f)
+    except OSError:
+        pass
+
 def get_git_info():
-    """Get information about the git repository."""
+    """Get information about the git repository.
+    
+    Results are cached per HEAD commit so repeated runs on an unchanged
+    checkout only need a single `git rev-parse`.
+    """
     try:
-        # Get the current commit hash
-        commit_hash = subprocess.check_output(
-            ["git", "rev-parse", "HEAD"], universal_newlines=True
-        ).strip()
+        git_dir, head_sha = _git("rev-parse", "--git-dir", "HEAD").splitlines()
         
-        # Get the current branch name
-        branch = subprocess.check_output(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], universal_newlines=True
-        ).strip()
+        try:
+            head_mtime = os.stat(os.path.join(git_dir, "HEAD")).st_mtime_ns
+        except OSError:
+            head_mtime = None
         
-        # Get commit date
-        commit_date = subprocess.check_output(
-            ["git", "show", "-s", "--format=%ci", "HEAD"], universal_newlines=True
-        ).strip()
+        cache_path = os.path.join(GIT_INFO_CACHE_DIR, f"gitinfo-{head_sha}.json")
+        git_info = _load_cached_git_info(cache_path, head_mtime)
+        if git_info is None:
+            git_info = _query_git_info()
+            _store_cached_git_info(cache_path, head_mtime, git_info)
         
-        # Get commit count
-        commit_count = subprocess.check_output(
-            ["git", "rev-list", "--count", "HEAD"], universal_newlines=True
-        ).strip()
-        
-        return {
-            "commit_hash": commit_hash,
-            "branch": branch,
-            "commit_date": commit_date,
-            "commit_count": commit_count
-        }
+        return git_info
     except subprocess.CalledProcessError:
         return None
     except FileNotFoundError:
         return None
+    except ValueError:
+        # Unexpected output format
+        return None
+
+def _find_version_assignments(content):
+    """Locate the managed string assignments in version.py source.
+    
+    Returns:
+        dict: Field name -> the ast.Constant node holding its value
+    """
+    nodes = {}
+    for node in ast.parse(content).body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+                isinstance(node.targets[0], ast.Name) and
+                node.targets[0].id in VERSION_FIELDS and
+                isinstance(node.value, ast.Constant) and
+                isinstance(node.value.value, str)):
+            nodes.setdefault(VERSION_FIELDS[node.targets[0].id], node.value)
+    return nodes
+
+def _replace_values(content, nodes, replacements):
+    """Replace the source span of each value node with a new string literal."""
+    # AST column offsets are in UTF-8 bytes, so splice on the encoded source
+    lines = content.encode("utf-8").splitlines(keepends=True)
+    line_starts = [0]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+    
+    source = b"".join(lines)
+    # Splice from the end of the file so earlier offsets stay valid
+    for field, node in sorted(nodes.items(), key=lambda item: item[1].lineno, reverse=True):
+        start = line_starts[node.lineno - 1] + node.col_offset
+        end = line_starts[node.end_lineno - 1] + node.end_col_offset
+        literal = f'"{replacements[field]}"'.encode("utf-8")
+        source = source[:start] + literal + source[end:]
+    
+    return source.decode("utf-8")
 
 def update_version(version_file, increment_type=None, new_version=None):
     """Update the version information in the version file.
@@ -67,15 +159,18 @@ def update_version(version_file, increment_type=None, new_version=None):
         content = f.read()
     
     # Extract current version information
-    version_match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-    build_match = re.search(r'__build__\s*=\s*["\']([^"\']+)["\']', content)
+    try:
+        value_nodes = _find_version_assignments(content)
+    except SyntaxError as e:
+        print(f"Error: Could not parse the version file: {e}")
+        sys.exit(1)
     
-    if not version_match or not build_match:
+    if "version" not in value_nodes or "build" not in value_nodes:
         print("Error: Could not find version information in the file.")
         sys.exit(1)
     
-    current_version = version_match.group(1)
-    current_build = build_match.group(1)
+    current_version = value_nodes["version"].value
+    current_build = value_nodes["build"].value
     
     # Parse the current version
     version_parts = current_version.split('.')
@@ -122,21 +217,12 @@ def update_version(version_file, increment_type=None, new_version=None):
     release_date = today.strftime('%Y-%m-%d')
     
     # Update the content with new version info
-    updated_content = re.sub(
-        r'__version__\s*=\s*["\']([^"\']+)["\']',
-        f'__version__ = "{updated_version}"',
-        content
-    )
-    updated_content = re.sub(
-        r'__build__\s*=\s*["\']([^"\']+)["\']',
-        f'__build__ = "{updated_build}"',
-        updated_content
-    )
-    updated_content = re.sub(
-        r'__release_date__\s*=\s*["\']([^"\']+)["\']',
-        f'__release_date__ = "{release_date}"',
-        updated_content
-    )
+    replacements = {
+        "version": updated_version,
+        "build": updated_build,
+        "release_date": release_date
+    }
+    updated_content = _replace_values(content, value_nodes, replacements)
     
     # Write the updated content back to the file
     with open(version_file, 'w') as f:
@@ -3,18 +3,23 @@ import os
 import argparse
 import colorama
 import logging
+import logging.handlers
+import atexit
 import concurrent.futures
+import multiprocessing
 import sys
 import signal
+import time
 from datetime import datetime
+from rich.layout import Layout
 from rich.live import Live
-from rich.prompt import Prompt, Confirm
+from rich.prompt import Prompt, Confirm, FloatPrompt
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich import print as rprint
 from .core.analyzer import VideoAnalyzer
-from .ui.main_menu import MainMenu
+from .core.metadata_cache import MetadataCache
 from .utils.display import DisplayManager
 from .utils.banner import show_banner
 from .version import __version__, __build__, get_version_string
@@ -22,6 +27,28 @@ from .version import __version__, __build__, get_version_string
 # Global flag for graceful shutdown
 SHUTDOWN_REQUESTED = False
 
+# Shared console for prompts and status output
+console = Console()
+
+# Per-user directory holding logs and, by default, moved files
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".video_analyzer")
+
+# Queue feeding the background log writer, shared with worker processes
+LOG_QUEUE = None
+
+# Default worker processes per CPU. Workers spend most of their time waiting
+# on ffprobe and ffmpeg child processes, so more workers than CPUs keep
+# several probes in flight per core and hide their startup latency.
+WORKERS_PER_CPU = 2
+
+# ProcessPoolExecutor cannot wait on more than 61 workers on Windows
+MAX_WINDOWS_WORKERS = 61
+
+# Niceness added to worker processes so the main process, which draws the
+# progress display, wins when the workers and their ffprobe children
+# compete for CPU time
+WORKER_NICENESS = 5
+
 def signal_handler(sig, frame):
     """Handle interruption signals gracefully"""
     global SHUTDOWN_REQUESTED
@@ -35,7 +62,7 @@ def signal_handler(sig, frame):
 def setup_logging(log_path=None):
     """Setup logging configuration"""
     if log_path is None:
-        log_dir = os.path.join(os.path.expanduser("~"), ".video_analyzer", "logs")
+        log_dir = os.path.join(APP_DATA_DIR, "logs")
         os.makedirs(log_dir, exist_ok=True)
         log_filename = f"video_analyzer_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         log_path = os.path.join(log_dir, log_filename)
@@ -45,20 +72,36 @@ def setup_logging(log_path=None):
         if log_dir:
             os.makedirs(log_dir, exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(message)s',
-        handlers=[
-            logging.FileHandler(log_path),
-            logging.StreamHandler()  # Also log to console
-        ]
-    )
+    # Configure logging. Callers only enqueue records; a listener thread
+    # does the file and console writes so they never block the scan loop.
+    # A multiprocessing queue lets worker processes log through it as well.
+    global LOG_QUEUE
+    LOG_QUEUE = multiprocessing.Queue(-1)
+    
+    formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()  # Also log to console
+    stream_handler.setFormatter(formatter)
+    
+    listener = logging.handlers.QueueListener(LOG_QUEUE, file_handler, stream_handler)
+    listener.start()
+    # Flush remaining records on exit
+    atexit.register(listener.stop)
+    
+    _use_log_queue(LOG_QUEUE)
     return log_path
 
+def _use_log_queue(log_queue):
+    """Route all root logger output through a queue."""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
 def get_initial_settings():
     """Get initial settings from user through interactive prompt."""
-    console = Console()
     console.clear()
     
     # Create welcome panel
@@ -71,87 +114,89 @@ def get_initial_settings():
     )
     console.print(welcome)
     
-    # Get video directory
+    # Keep asking until the user accepts the configuration
     while True:
-        video_dir = Prompt.ask(
-            "\n[yellow]Enter the path to your video directory[/yellow]",
-            default=os.getcwd()
+        # Get video directory
+        while True:
+            video_dir = Prompt.ask(
+                "\n[yellow]Enter the path to your video directory[/yellow]",
+                default=os.getcwd()
+            )
+            video_dir = os.path.expanduser(video_dir)  # Expand ~/ if present
+            if os.path.isdir(video_dir):
+                break
+            console.print("[red]Directory does not exist. Please enter a valid path.[/red]")
+        
+        # Get log file settings
+        use_custom_log = Confirm.ask(
+            "\n[yellow]Would you like to specify a custom log file location?[/yellow]",
+            default=False
         )
-        video_dir = os.path.expanduser(video_dir)  # Expand ~/ if present
-        if os.path.exists(video_dir):
-            break
-        console.print("[red]Directory does not exist. Please enter a valid path.[/red]")
-    
-    # Get log file settings
-    use_custom_log = Confirm.ask(
-        "\n[yellow]Would you like to specify a custom log file location?[/yellow]",
-        default=False
-    )
-    
-    if use_custom_log:
-        log_path = Prompt.ask(
-            "[yellow]Enter the path for the log file[/yellow]",
-            default=os.path.join(os.getcwd(), 'video_analyzer.log')
+        
+        if use_custom_log:
+            log_path = Prompt.ask(
+                "[yellow]Enter the path for the log file[/yellow]",
+                default=os.path.join(os.getcwd(), 'video_analyzer.log')
+            )
+            log_path = os.path.expanduser(log_path)  # Expand ~/ if present
+        else:
+            log_path = None  # Will use default location
+        
+        # Get similarity threshold; FloatPrompt re-asks on non-numeric input
+        while True:
+            similarity = FloatPrompt.ask(
+                "\n[yellow]Enter minimum similarity threshold for duplicate detection (0.0-1.0)[/yellow]",
+                default=0.95
+            )
+            if 0.0 <= similarity <= 1.0:
+                break
+            console.print("[red]Please enter a value between 0.0 and 1.0.[/red]")
+        
+        # Get dry run preference
+        dry_run = Confirm.ask(
+            "\n[yellow]Enable dry run mode? (no actual deletions will be performed)[/yellow]",
+            default=True
         )
-        log_path = os.path.expanduser(log_path)  # Expand ~/ if present
-    else:
-        log_path = None  # Will use default location
-    
-    # Get similarity threshold
-    similarity = float(Prompt.ask(
-        "\n[yellow]Enter minimum similarity threshold for duplicate detection (0.0-1.0)[/yellow]",
-        default="0.95"
-    ))
-    
-    # Get dry run preference
-    dry_run = Confirm.ask(
-        "\n[yellow]Enable dry run mode? (no actual deletions will be performed)[/yellow]",
-        default=True
-    )
-    
-    # Get output directory for moved files
-    move_files = Confirm.ask(
-        "\n[yellow]Move files instead of deleting them?[/yellow]",
-        default=True
-    )
-    
-    output_dir = None
-    if move_files:
-        output_dir = Prompt.ask(
-            "[yellow]Enter directory to move files to[/yellow]",
-            default=os.path.join(os.path.expanduser("~"), ".video_analyzer", "moved_files")
+        
+        # Get output directory for moved files
+        move_files = Confirm.ask(
+            "\n[yellow]Move files instead of deleting them?[/yellow]",
+            default=True
         )
-        output_dir = os.path.expanduser(output_dir)  # Expand ~/ if present
-    
-    # Show summary
-    console.print("\n[cyan]Configuration Summary:[/cyan]")
-    summary = Table.grid()
-    summary.add_column(style="bold")
-    summary.add_column()
-    summary.add_row("Video Directory:", video_dir)
-    summary.add_row("Log File:", log_path if log_path else "Default location")
-    summary.add_row("Similarity Threshold:", str(similarity))
-    summary.add_row("Dry Run Mode:", "Yes" if dry_run else "No")
-    summary.add_row("Move Files:", "Yes" if move_files else "No")
-    if move_files:
-        summary.add_row("Output Directory:", output_dir)
-    console.print(summary)
-    
-    if not Confirm.ask("\n[yellow]Proceed with these settings?[/yellow]", default=True):
-        return get_initial_settings()
-    
-    return {
-        'directory': video_dir,
-        'log_path': log_path,
-        'min_similarity': similarity,
-        'dry_run': dry_run,
-        'output_dir': output_dir
-    }
+        
+        output_dir = None
+        if move_files:
+            output_dir = Prompt.ask(
+                "[yellow]Enter directory to move files to[/yellow]",
+                default=os.path.join(APP_DATA_DIR, "moved_files")
+            )
+            output_dir = os.path.expanduser(output_dir)  # Expand ~/ if present
+        
+        # Show summary
+        console.print("\n[cyan]Configuration Summary:[/cyan]")
+        summary = Table.grid()
+        summary.add_column(style="bold")
+        summary.add_column()
+        summary.add_row("Video Directory:", video_dir)
+        summary.add_row("Log File:", log_path if log_path else "Default location")
+        summary.add_row("Similarity Threshold:", str(similarity))
+        summary.add_row("Dry Run Mode:", "Yes" if dry_run else "No")
+        summary.add_row("Move Files:", "Yes" if move_files else "No")
+        if move_files:
+            summary.add_row("Output Directory:", output_dir)
+        console.print(summary)
+        
+        if Confirm.ask("\n[yellow]Proceed with these settings?[/yellow]", default=True):
+            return {
+                'directory': video_dir,
+                'log_path': log_path,
+                'min_similarity': similarity,
+                'dry_run': dry_run,
+                'output_dir': output_dir
+            }
 
 def check_dependencies():
     """Check if required dependencies are installed"""
-    console = Console()
-    
     # Check for ffmpeg/ffprobe
     try:
         from .core.video_metadata import VideoMetadata
@@ -166,31 +211,61 @@ def check_dependencies():
     
     return True
 
-def process_video_batch(args):
-    """Process a batch of video files in parallel."""
-    files, analyzer, callback = args
-    results = []
-    for file in files:
-        if SHUTDOWN_REQUESTED:
-            break
+def _init_worker(log_queue):
+    """Prepare a worker process for metadata extraction.
+    
+    Interrupts are ignored since the main process handles shutdown, and
+    log records are sent to the main process's log listener. Where
+    supported, the worker also lowers its scheduling priority.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(os, 'nice'):
         try:
-            metadata = analyzer.process_single_file(file)
-            if metadata and callback:
-                callback(file)
-            if metadata:
-                results.append((file, metadata))
-        except Exception as e:
-            logging.error(f"Error processing {file}: {str(e)}")
-    return results
+            os.nice(WORKER_NICENESS)
+        except OSError:
+            pass
+    if log_queue is not None:
+        _use_log_queue(log_queue)
+
+def process_video_file(file):
+    """Extract metadata for a single video file in a worker process."""
+    try:
+        return file, VideoAnalyzer.extract_file_metadata(file)
+    except Exception as e:
+        logging.error(f"Error processing {file}: {str(e)}")
+        return file, None
+
+def similarity_threshold(value):
+    """Argparse type for a similarity threshold between 0.0 and 1.0."""
+    try:
+        threshold = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid similarity threshold: {value!r}")
+    if not 0.0 <= threshold <= 1.0:
+        raise argparse.ArgumentTypeError(f"similarity threshold must be between 0.0 and 1.0, got {value}")
+    return threshold
+
+def job_count(value):
+    """Argparse type for a positive number of worker processes."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid job count: {value!r}")
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"job count must be at least 1, got {value}")
+    return jobs
 
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Video Analyzer - Find and manage duplicate video files")
     parser.add_argument("-d", "--directory", help="Directory to scan for video files")
     parser.add_argument("-l", "--log", help="Log file path")
-    parser.add_argument("-s", "--similarity", type=float, default=0.95, help="Similarity threshold (0.0-1.0)")
+    parser.add_argument("-s", "--similarity", type=similarity_threshold, default=0.95, help="Similarity threshold (0.0-1.0)")
     parser.add_argument("--dry-run", action="store_true", help="Perform a dry run (no deletions)")
     parser.add_argument("-m", "--move-to", help="Move files instead of deleting them")
+    parser.add_argument("-j", "--jobs", type=job_count, help="Number of worker processes (default: twice the CPU count)")
+    parser.add_argument("--scan-threads", type=job_count, help="Number of threads listing directories (default: auto)")
+    parser.add_argument("--no-cache", action="store_true", help="Probe every file instead of using cached metadata")
     parser.add_argument("-n", "--non-interactive", action="store_true", help="Run in non-interactive mode")
     parser.add_argument("--no-update-check", action="store_true", help="Disable update check")
     
@@ -202,8 +277,10 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Initialize colorama for cross-platform colored terminal output
-    colorama.init(autoreset=True)
+    # Enable ANSI colors on Windows consoles. Unlike colorama.init(), this
+    # leaves stdout unwrapped where the console supports VT sequences, so
+    # Rich output is not filtered through colorama on every write
+    colorama.just_fix_windows_console()
     
     # Parse command line arguments
     args = parse_arguments()
@@ -211,14 +288,13 @@ def main():
     # Show the welcome banner unless in non-interactive mode
     if not args.non_interactive:
         show_banner()
-        console = Console()
         console.print(f"[cyan]Video Analyzer {get_version_string()}[/cyan]")
         console.print()
     
     # Check for updates (unless in non-interactive mode or explicitly disabled)
     if not args.non_interactive and not args.no_update_check:
         from .utils.updater import UpdateChecker
-        update_checker = UpdateChecker(console=Console())
+        update_checker = UpdateChecker(console=console)
         update_info = update_checker.check_for_updates()
         if update_info:
             console.print("[yellow]An update is available. You can update from the main menu.[/yellow]")
@@ -244,14 +320,17 @@ def main():
     else:
         # Interactive mode - either use command-line args as defaults or prompt user
         settings = get_initial_settings()
+    settings['jobs'] = args.jobs
+    settings['scan_threads'] = args.scan_threads
+    settings['use_cache'] = not args.no_cache
     
     # Setup logging
     log_file = setup_logging(settings['log_path'])
     logging.info(f"Starting video analysis of directory: {settings['directory']}")
     logging.info(f"Log file: {log_file}")
     
-    # Create display manager
-    display = DisplayManager()
+    # Create display manager sharing the module console
+    display = DisplayManager(console=console)
     
     try:
         # Create analyzer
@@ -264,7 +343,7 @@ def main():
         
         # Find video files
         logging.info(f"Scanning directory: {settings['directory']}")
-        video_files = analyzer.find_video_files()
+        video_files = analyzer.find_video_files(threads=settings['scan_threads'])
         total_files = len(video_files)
         logging.info(f"Found {total_files} video files")
         
@@ -279,9 +358,9 @@ def main():
         # Add the progress panel to the layout - create a new slot for it
         # First make sure the layout has room for progress
         layout["right_panel"].split_column(
-            layout(name="progress", ratio=1),
-            layout(name="current_file", ratio=1),
-            layout(name="processing_log", ratio=2)
+            Layout(name="progress", ratio=1),
+            Layout(name="current_file", ratio=1),
+            Layout(name="processing_log", ratio=2)
         )
         
         # Process files with live display
@@ -290,55 +369,94 @@ def main():
             task = progress.add_task("Analyzing videos...", total=total_files)
             layout["progress"].update(progress)
             
+            # Rebuilding the layout panels is far more expensive than
+            # tracking a file, so only do it as often as Live redraws
+            ui_interval = 0.25
+            last_ui_update = 0.0
+            
+            def refresh_layout():
+                # Update additional statistics from the analyzer's running totals
+                display.duplicate_groups = analyzer.duplicate_group_count
+                display.total_size = analyzer.duplicate_total_size
+                display.potential_savings = analyzer.duplicate_potential_savings
+                
+                # Update the entire layout with latest info
+                display.update_layout(layout)
+            
             def update_progress(filename):
+                nonlocal last_ui_update
+                
                 # Log processing to update the display tracker
                 display.log_processing(filename)
                 
                 # Update progress
                 progress.advance(task)
                 
-                # Update the entire layout with latest info
-                display.update_layout(layout)
-                
-                # Update additional statistics
-                display.duplicate_groups = len(analyzer.duplicates)
-                display.total_size = sum(sum(analyzer._get_file_size(f['path']) 
-                                          for f in group) 
-                                      for group in analyzer.duplicates.values())
-                display.potential_savings = sum(sum(analyzer._get_file_size(f['path']) 
-                                             for f in group[1:]) 
-                                          for group in analyzer.duplicates.values())
+                now = time.monotonic()
+                if now - last_ui_update >= ui_interval:
+                    last_ui_update = now
+                    refresh_layout()
             
-            # Process files in parallel
-            max_workers = min(os.cpu_count() or 4, 8)  # Limit to 8 workers max
-            batch_size = max(10, total_files // (max_workers * 2))  # Ensure enough batches
+            def record_result(file_path, metadata):
+                analyzer.record_file_metadata(file_path, metadata)
+                analyzer.add_file_metadata(file_path, metadata)
+                update_progress(file_path)
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Split files into batches
-                batches = [video_files[i:i + batch_size] 
-                          for i in range(0, len(video_files), batch_size)]
-                
-                # Create tasks for each batch
-                futures = []
-                for batch in batches:
+            # Files unchanged since a previous run are served from the
+            # persistent cache; only the rest are sent to ffprobe
+            cache = MetadataCache() if settings['use_cache'] else None
+            signatures = {}
+            new_entries = []
+            try:
+                pending_files = []
+                for file_path in video_files:
                     if SHUTDOWN_REQUESTED:
                         break
-                    future = executor.submit(
-                        process_video_batch,
-                        (batch, analyzer, update_progress)
-                    )
-                    futures.append(future)
+                    signature = analyzer.get_file_signature(file_path)
+                    metadata = cache.get(file_path, *signature) if cache and signature else None
+                    if metadata:
+                        record_result(file_path, metadata)
+                    else:
+                        signatures[file_path] = signature
+                        pending_files.append(file_path)
+                logging.info(f"{total_files - len(pending_files)} files served from metadata cache")
                 
-                # Process results as they complete
-                for future in concurrent.futures.as_completed(futures):
-                    if SHUTDOWN_REQUESTED:
-                        break
-                    results = future.result()
-                    for file_path, metadata in results:
-                        analyzer.add_file_metadata(file_path, metadata)
-                        
-                    # Update the progress display
-                    live.refresh()
+                # Process files in parallel. Metadata extraction runs in worker
+                # processes so JSON parsing and filename matching are not
+                # serialized by the GIL; results are recorded in this process.
+                max_workers = settings['jobs'] or (os.cpu_count() or 2) * WORKERS_PER_CPU
+                if sys.platform == 'win32':
+                    max_workers = min(max_workers, MAX_WINDOWS_WORKERS)
+                
+                with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                            initializer=_init_worker,
+                                                            initargs=(LOG_QUEUE,)) as executor:
+                    # Probe times vary widely between files and dwarf the cost of
+                    # passing a file to a worker, so each idle worker takes one
+                    # file at a time instead of a fixed-size chunk. Results
+                    # stream back in order, which keeps group order stable.
+                    results = executor.map(process_video_file, pending_files)
+                    try:
+                        for file_path, metadata in results:
+                            if SHUTDOWN_REQUESTED:
+                                break
+                            if metadata:
+                                record_result(file_path, metadata)
+                                signature = signatures[file_path]
+                                if signature:
+                                    new_entries.append((file_path, *signature, metadata))
+                    finally:
+                        # Closing the iterator cancels chunks that have not started
+                        results.close()
+            finally:
+                # Save whatever was probed, even if the scan was interrupted
+                if cache:
+                    cache.put_many(new_entries)
+                    cache.close()
+            
+            # Show the final state regardless of when the last update ran
+            refresh_layout()
+            live.refresh()
         
         # If shutdown was requested, exit gracefully
         if SHUTDOWN_REQUESTED:
@@ -360,7 +478,8 @@ def main():
         
         # Show menu in interactive mode only
         if not args.non_interactive:
-            menu = MainMenu(analyzer)
+            from .ui.main_menu import MainMenu
+            menu = MainMenu(analyzer, display)
             menu.show_menu()
         else:
             # In non-interactive mode, just print duplicate groups
@@ -382,4 +501,6 @@ def main():
     return 0
 
 if __name__ == '__main__':
+    # Required for worker processes in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     exit(main()) 
\ No newline at end of file
@@ -1,9 +1,9 @@
 import os
+import sys
 import logging
 import concurrent.futures
 from collections import defaultdict
-from typing import Dict, List, Set, Optional, Callable, Tuple, Any
-import hashlib
+from typing import Dict, Iterable, List, Set, Optional, Callable, Tuple, Any
 from functools import lru_cache
 import re
 from multiprocessing import cpu_count
@@ -11,6 +11,64 @@ from .video_metadata import VideoMetadata
 from .content_info import ContentInfo
 import humanize
 
+# File extensions treated as video files when scanning
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v'})
+
+# Concurrent removals when deleting selected files
+DELETE_THREADS = 16
+
+# Quality and release indicators stripped from filenames before comparing them
+QUALITY_INDICATORS = frozenset({
+    '1080p', '720p', '480p', '2160p', '4k', 'uhd', 'hd', '8k',
+    'dvdrip', 'bdrip', 'webdl', 'web-dl', 'webrip', 'bluray', 'web', 'hdtv',
+    'x264', 'x265', 'h264', 'h265', 'hevc', 'xvid', 'divx',
+    'remux', 'hdr', 'dolby', 'atmos', 'truehd', 'dts'
+})
+# Matches any word containing one of the indicators
+QUALITY_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, sorted(QUALITY_INDICATORS))))
+# Characters str.isalnum() rejects: non-word characters and underscores
+NON_ALNUM_PATTERN = re.compile(r'[\W_]+')
+# Years like (2020), [2020] or .2020.
+YEAR_TOKEN_PATTERN = re.compile(r'[\(\[\.]?\d{4}[\)\]\.]?')
+
+# Perceptual hashes at most this many bits apart show the same picture
+PHASH_MAX_DISTANCE = 6
+# ...provided the durations agree this closely
+PHASH_MIN_DURATION_RATIO = 0.98
+# Bit ranges splitting a 64-bit hash into PHASH_MAX_DISTANCE + 1 blocks
+PHASH_BLOCKS = [
+    (64 * i // (PHASH_MAX_DISTANCE + 1), 64 * (i + 1) // (PHASH_MAX_DISTANCE + 1))
+    for i in range(PHASH_MAX_DISTANCE + 1)
+]
+
+# Directory listings run concurrently on network mounts, where each one
+# waits on a server round trip rather than the local disk
+NETWORK_SCAN_THREADS = 32
+NETWORK_FILESYSTEMS = frozenset({'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', 'afpfs', '9p'})
+
+@lru_cache(maxsize=4096)
+def _natural_size(size: int) -> str:
+    """Format a file size with humanize, cached for repeats within a duplicate group."""
+    return humanize.naturalsize(size)
+
+def _is_network_path(path: str) -> bool:
+    """Return True if path is on a known network filesystem (Linux only)."""
+    try:
+        with open('/proc/self/mounts', 'r') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    
+    # The longest mount point containing the path is the one it lives on
+    best_mount, best_type = '', None
+    path = os.path.realpath(path)
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) \
+                and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+    return best_type in NETWORK_FILESYSTEMS
+
 class VideoAnalyzer:
     def __init__(self, directory: str, output_dir: Optional[str] = None, dry_run: bool = False, min_similarity: float = 0.95):
         self.directory = os.path.abspath(directory)
@@ -23,6 +81,13 @@ class VideoAnalyzer:
         self._metadata_cache = {}
         # Cache of file sizes for better performance
         self._file_size_cache = {}
+        # Modification times recorded by the directory scan
+        self._file_mtime_cache = {}
+        # Running totals for content groups with more than one file, kept
+        # up to date by add_file_metadata so progress displays never re-sum
+        self.duplicate_group_count = 0
+        self.duplicate_total_size = 0
+        self.duplicate_potential_savings = 0
         # Resolution groups for better organization
         self.resolution_groups = {
             'HD': [720, 1080],
@@ -35,28 +100,96 @@ class VideoAnalyzer:
         # Number of threads to use for parallel processing
         self.num_threads = max(4, cpu_count() * 2)  # Use 2x CPU cores for I/O bound tasks
     
-    def find_video_files(self) -> List[str]:
-        """Find all video files in the directory and subdirectories."""
-        video_extensions = {'.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
-        video_files = []
+    def find_video_files(self, threads: Optional[int] = None) -> List[str]:
+        """Find all video files in the directory and subdirectories.
+        
+        Args:
+            threads: Number of threads scanning directories concurrently.
+                Defaults to NETWORK_SCAN_THREADS on network filesystems,
+                where each listing is a network round trip, and 1 elsewhere.
+        """
+        if threads is None:
+            threads = NETWORK_SCAN_THREADS if _is_network_path(self.directory) else 1
         
         logging.info(f"Scanning directory: {self.directory}")
-        # Use os.walk with topdown=True for better memory usage
-        for dirpath, _, filenames in os.walk(self.directory, topdown=True):
-            for filename in filenames:
-                ext = os.path.splitext(filename)[1].lower()
-                if ext in video_extensions:
-                    file_path = os.path.join(dirpath, filename)
-                    video_files.append(file_path)
-                    # Cache file size while we're at it
-                    try:
-                        self._file_size_cache[file_path] = os.path.getsize(file_path)
-                    except OSError:
-                        logging.warning(f"Could not get size of {file_path}")
+        # Walk the tree with os.scandir so file type checks and sizes come
+        # from the directory entries instead of separate stat calls.
+        # Directories are visited depth-first in listing order, like os.walk.
+        if threads > 1:
+            found = self._scan_tree_threaded(threads)
+        else:
+            found = self._scan_tree()
+        
+        video_files = []
+        for path, size, mtime_ns in found:
+            video_files.append(path)
+            # Cache file size and modification time while we're at it
+            if size is not None:
+                self._file_size_cache[path] = size
+                self._file_mtime_cache[path] = mtime_ns
         
         logging.info(f"Found {len(video_files)} video files")
         return video_files
     
+    def _scan_tree(self):
+        """Yield (path, size, mtime_ns) for each video file, one directory at a time."""
+        pending_dirs = [self.directory]
+        while pending_dirs:
+            videos, subdirs = self._scan_directory(pending_dirs.pop())
+            yield from videos
+            pending_dirs.extend(reversed(subdirs))
+    
+    def _scan_tree_threaded(self, threads: int):
+        """Yield (path, size, mtime_ns) for each video file, listing directories in parallel.
+        
+        Each scan submits its subdirectories as soon as it has listed them,
+        so the pool stays busy across the whole tree, while results are
+        still consumed in the same depth-first order as _scan_tree.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            def scan(path):
+                videos, subdirs = self._scan_directory(path)
+                return videos, [executor.submit(scan, subdir) for subdir in subdirs]
+            
+            pending = [executor.submit(scan, self.directory)]
+            while pending:
+                videos, children = pending.pop().result()
+                yield from videos
+                pending.extend(reversed(children))
+    
+    @staticmethod
+    def _scan_directory(path: str) -> Tuple[List[Tuple[str, Optional[int], Optional[int]]], List[str]]:
+        """List one directory, returning its video files with stat info and its subdirectories."""
+        videos = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into symlinked directories
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    
+                    # Slice the extension directly rather than via splitext;
+                    # a leading dot marks a hidden file, not an extension
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in VIDEO_EXTENSIONS:
+                        try:
+                            stat = entry.stat()
+                            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                        except OSError:
+                            logging.warning(f"Could not get size of {entry.path}")
+                            size = mtime_ns = None
+                        videos.append((entry.path, size, mtime_ns))
+        except OSError as e:
+            logging.warning(f"Could not scan directory {path}: {str(e)}")
+        return videos, subdirs
+    
     def process_single_file(self, file_path: str) -> Optional[Dict]:
         """Process a single video file and return its metadata."""
         try:
@@ -64,37 +197,70 @@ class VideoAnalyzer:
             if file_path in self._metadata_cache:
                 return self._metadata_cache[file_path]
             
-            # Get metadata
-            metadata = VideoMetadata.get_video_metadata(file_path)
+            metadata = self.extract_file_metadata(file_path)
             if metadata:
-                # Extract content info from filename
-                content_info = ContentInfo.extract_title_info(os.path.basename(file_path))
-                metadata.update(content_info)
-                
-                # Classify resolution
-                height = metadata.get('height', 0)
-                metadata['resolution_category'] = self._classify_resolution(height)
-                
-                # Update statistics
-                self.content_types[metadata.get('type', 'unknown')] += 1
-                self.resolution_stats[metadata['resolution_category']] += 1
-                
-                # Cache the enhanced metadata
-                self._metadata_cache[file_path] = metadata
-                
-                # Cache file size if not already cached
-                if file_path not in self._file_size_cache:
-                    try:
-                        self._file_size_cache[file_path] = os.path.getsize(file_path)
-                    except OSError:
-                        pass
+                self.record_file_metadata(file_path, metadata)
             return metadata
             
         except Exception as e:
             logging.error(f"Error processing {file_path}: {str(e)}")
             return None
     
-    def _classify_resolution(self, height: int) -> str:
+    @staticmethod
+    def extract_file_metadata(file_path: str) -> Optional[Dict]:
+        """Extract enhanced metadata for a file without touching analyzer state.
+        
+        This only depends on its argument, so it can run in worker processes.
+        """
+        # Get metadata
+        metadata = VideoMetadata.get_video_metadata(file_path)
+        if metadata:
+            # Extract content info from filename
+            content_info = ContentInfo.extract_title_info(os.path.basename(file_path))
+            metadata.update(content_info)
+            
+            # Classify resolution
+            height = metadata.get('height', 0)
+            metadata['resolution_category'] = VideoAnalyzer._classify_resolution(height)
+            
+            # Fingerprint the content so exact copies match outright, and
+            # the picture so re-encodes can be matched by Hamming distance
+            metadata['content_hash'] = VideoMetadata.compute_signature(file_path)
+            metadata['phash'] = VideoMetadata.compute_perceptual_hash(
+                file_path, metadata.get('duration_value', 0)
+            )
+        return metadata
+    
+    def record_file_metadata(self, file_path: str, metadata: Dict) -> None:
+        """Update statistics and caches for metadata extracted from a file."""
+        # Update statistics
+        self.content_types[metadata.get('type', 'unknown')] += 1
+        self.resolution_stats[metadata['resolution_category']] += 1
+        
+        # Cache the enhanced metadata
+        self._metadata_cache[file_path] = metadata
+        
+        # Cache file size if not already cached
+        if file_path not in self._file_size_cache:
+            try:
+                self._file_size_cache[file_path] = os.path.getsize(file_path)
+            except OSError:
+                pass
+    
+    def get_file_signature(self, file_path: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, preferring values from the scan."""
+        if file_path in self._file_mtime_cache:
+            return self._file_mtime_cache[file_path], self._file_size_cache[file_path]
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        self._file_size_cache[file_path] = stat.st_size
+        self._file_mtime_cache[file_path] = stat.st_mtime_ns
+        return stat.st_mtime_ns, stat.st_size
+    
+    @staticmethod
+    def _classify_resolution(height: int) -> str:
         """Classify video resolution into categories."""
         if height <= 0:
             return "Unknown"
@@ -115,11 +281,28 @@ class VideoAnalyzer:
         content_signature = self._create_content_signature(metadata, file_path)
         
         # Add file info to content data
-        self.content_data[content_signature].append({
+        group = self.content_data[content_signature]
+        # Carry the size along so sorting and reporting never stat again.
+        # Metadata arrives unpickled from worker processes, so every file
+        # holds its own copy of strings like codec names and field keys;
+        # interning lets all files share one copy of each.
+        size = self._get_file_size(file_path)
+        group.append({
             'path': file_path,
             'filename': os.path.basename(file_path),
-            **metadata
+            'size': size,
+            **{sys.intern(key): sys.intern(value) if type(value) is str else value
+               for key, value in metadata.items()}
         })
+        
+        # Update running duplicate totals; every file after the first in a
+        # group counts towards potential savings
+        if len(group) > 1:
+            if len(group) == 2:
+                self.duplicate_group_count += 1
+                self.duplicate_total_size += group[0]['size']
+            self.duplicate_total_size += size
+            self.duplicate_potential_savings += size
     
     def scan_video_files(self, video_files: List[str], progress_callback: Optional[Callable] = None) -> None:
         """Process the video files and extract metadata using optimized parallel processing."""
@@ -173,35 +356,31 @@ class VideoAnalyzer:
                 if progress_callback:
                     progress_callback(file_path)
     
-    @lru_cache(maxsize=1024)
-    def _clean_filename(self, filename: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _clean_filename(filename: str) -> str:
         """Clean filename by removing quality indicators and non-alphanumeric chars."""
-        # Enhanced list of quality and release indicators
-        quality_indicators = {
-            '1080p', '720p', '480p', '2160p', '4k', 'uhd', 'hd', '8k',
-            'dvdrip', 'bdrip', 'webdl', 'web-dl', 'webrip', 'bluray', 'web', 'hdtv',
-            'x264', 'x265', 'h264', 'h265', 'hevc', 'xvid', 'divx',
-            'remux', 'hdr', 'dolby', 'atmos', 'truehd', 'dts'
-        }
-        
         # Extract show/movie name and remove quality indicators
         # Get base name without extension
         base_name = os.path.splitext(filename)[0].lower()
         
         # Remove year patterns like (2020) or [2020]
-        base_name = re.sub(r'[\(\[\.]?\d{4}[\)\]\.]?', ' ', base_name)
-        
-        # More efficient string cleaning
-        words = base_name.split()
-        cleaned_words = []
-        for word in words:
-            if word not in quality_indicators and not any(qi in word for qi in quality_indicators):
-                cleaned_words.append(''.join(c for c in word if c.isalnum()))
-        
-        return ' '.join(cleaned_words)
+        base_name = YEAR_TOKEN_PATTERN.sub(' ', base_name)
+        
+        # Drop words containing a quality indicator and strip the rest
+        # down to their alphanumeric characters
+        return ' '.join(
+            NON_ALNUM_PATTERN.sub('', word)
+            for word in base_name.split()
+            if not QUALITY_INDICATOR_PATTERN.search(word)
+        )
     
-    def _create_content_signature(self, metadata: Dict, file_path: str) -> str:
-        """Create a content signature for grouping similar videos with improved accuracy."""
+    def _create_content_signature(self, metadata: Dict, file_path: str) -> Tuple:
+        """Create a content signature for grouping similar videos with improved accuracy.
+        
+        Signatures are tuples, so they are built and compared without
+        formatting or hashing names into strings.
+        """
         # Get type (tv_show or movie)
         content_type = metadata.get('type', 'unknown')
         
@@ -211,8 +390,7 @@ class VideoAnalyzer:
             season = metadata.get('season', 0)
             episode = metadata.get('episode', 0)
             # Create signature for TV shows including show name, season and episode
-            name_hash = hashlib.md5(show_name.encode()).hexdigest()[:8]
-            return f"tv:{name_hash}|s{season:02d}e{episode:02d}"
+            return ('tv', show_name, season, episode)
         
         # For movies, use duration, file name, and size range
         else:
@@ -226,26 +404,27 @@ class VideoAnalyzer:
             # Round duration to nearest second to account for small variations
             duration_key = round(duration)
             
-            # Use a hash of the base name for better differentiation
-            name_hash = hashlib.md5(base_name.encode()).hexdigest()[:8]
-            
-            return f"movie:{name_hash}|{duration_key}"
+            return ('movie', base_name, duration_key)
     
     def find_duplicates(self) -> Dict:
         """Identify duplicates using content signatures and metadata with improved resolution handling."""
         self.duplicates = {}
         duplicate_groups = 0
         
-        for content_signature, files in self.content_data.items():
+        for files in self._merge_matching_buckets():
             if len(files) > 1:
+                # Score each file once; the sort and the comparisons reuse it
+                for file_info in files:
+                    file_info['quality_score'] = self._calculate_quality_score(file_info)
+                
                 # Sort files by resolution and quality (highest to lowest)
                 files_sorted = sorted(
                     files,
                     key=lambda x: (
                         x.get('height', 0) * x.get('width', 0),  # Total pixels (resolution)
                         x.get('bitrate_value', 0),               # Bitrate
-                        -self._calculate_quality_score(x),       # Overall quality score
-                        -self._get_file_size(x['path'])          # Prefer smaller files if quality is the same
+                        -x['quality_score'],                     # Overall quality score
+                        -x['size']                               # Prefer smaller files if quality is the same
                     ),
                     reverse=True
                 )
@@ -260,7 +439,7 @@ class VideoAnalyzer:
                 # Add quality comparison data to each file for UI display
                 for file_info in files_sorted:
                     file_resolution = file_info.get('resolution', 'Unknown')
-                    file_info['is_highest_quality'] = (file_info == files_sorted[0])
+                    file_info['is_highest_quality'] = file_info is files_sorted[0]
                     file_info['compared_to_best'] = self._compare_to_highest_quality(
                         file_info, files_sorted[0]
                     )
@@ -278,20 +457,123 @@ class VideoAnalyzer:
                 self.duplicates[group_name] = files_sorted
                 duplicate_groups += 1
                 
-                # Log duplicate group details
-                logging.info(f"Found duplicate group: {group_name}")
+                # Log duplicate group details as one record per group; each
+                # record is pickled through the log queue and written twice
+                lines = [f"Found duplicate group: {group_name}"]
                 for file_info in files_sorted:
-                    size = self._get_file_size(file_info['path'])
+                    size = file_info['size']
                     resolution = file_info.get('resolution', 'Unknown')
                     bitrate = file_info.get('bitrate', 'Unknown')
-                    logging.info(
+                    lines.append(
                         f"  - {file_info['path']} "
-                        f"({resolution}, {bitrate}, {humanize.naturalsize(size)})"
+                        f"({resolution}, {bitrate}, {_natural_size(size)})"
                     )
+                logging.info("\n".join(lines))
         
         logging.info(f"Found {duplicate_groups} duplicate groups")
         return self.duplicates
     
+    def _merge_matching_buckets(self) -> List[List[Dict]]:
+        """Join content_data buckets that hold copies of the same video.
+        
+        Buckets are keyed by title and duration, so copies saved under
+        different names land in different buckets. Files with the same
+        content hash are byte-identical whatever their names, and files
+        whose perceptual hashes and durations nearly match are re-encodes,
+        so the buckets holding them are merged. Merging is transitive, so
+        a chain of re-encodes ends up in one group. Bucket order is kept.
+        """
+        buckets = list(self.content_data.values())
+        
+        # Union-find over bucket indices, with path halving
+        parent = list(range(len(buckets)))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        first_bucket = {}
+        # Files with a perceptual hash and a duration by hash block,
+        # as (duration, bucket, file)
+        by_phash_block = defaultdict(list)
+        for i, files in enumerate(buckets):
+            for file_info in files:
+                content_hash = file_info.get('content_hash')
+                if content_hash:
+                    parent[find(i)] = find(first_bucket.setdefault(content_hash, i))
+                
+                phash = file_info.get('phash')
+                if phash is not None and file_info.get('duration_value', 0) > 0:
+                    entry = (file_info['duration_value'], i, file_info)
+                    for key in self._phash_block_keys(phash):
+                        by_phash_block[key].append(entry)
+        
+        # Re-encodes share a hash block and their durations are within
+        # PHASH_MIN_DURATION_RATIO, so each file is only compared with the
+        # files following it in a block's duration-sorted window
+        for seen in by_phash_block.values():
+            seen.sort(key=lambda entry: entry[0])
+            for a, (duration, i, file_info) in enumerate(seen):
+                for b in range(a + 1, len(seen)):
+                    other_duration, j, other = seen[b]
+                    if duration < other_duration * PHASH_MIN_DURATION_RATIO:
+                        break
+                    # Only compare files whose buckets aren't joined yet
+                    if find(j) != find(i) and self._is_reencode(file_info, other):
+                        parent[find(i)] = find(j)
+        
+        merged = defaultdict(list)
+        for i, files in enumerate(buckets):
+            merged[find(i)].extend(files)
+        return list(merged.values())
+    
+    @staticmethod
+    def _phash_block_keys(phash: int) -> List[Tuple]:
+        """Keys for the blocks of a perceptual hash.
+        
+        Hashes within PHASH_MAX_DISTANCE bits differ in at most that many
+        blocks, so near matches always share at least one of these keys.
+        """
+        return [
+            ('phash', block, (phash >> start) & ((1 << (end - start)) - 1))
+            for block, (start, end) in enumerate(PHASH_BLOCKS)
+        ]
+    
+    def _is_reencode(self, file1: Dict, file2: Dict) -> bool:
+        """Whether two files show near-identical pictures at near-identical lengths.
+        
+        Episodes of one show often open on the same title card at much the
+        same length, so different episodes never count as re-encodes.
+        """
+        episode1 = self._episode_key(file1)
+        episode2 = self._episode_key(file2)
+        if episode1 is not None and episode2 is not None and episode1 != episode2:
+            return False
+        if self._phash_distance(file1, file2) > PHASH_MAX_DISTANCE:
+            return False
+        duration1 = file1.get('duration_value', 0)
+        duration2 = file2.get('duration_value', 0)
+        return (duration1 > 0 and duration2 > 0 and
+                min(duration1, duration2) / max(duration1, duration2) >= PHASH_MIN_DURATION_RATIO)
+    
+    @staticmethod
+    def _episode_key(file_info: Dict) -> Optional[Tuple]:
+        """(title, season, episode) of a TV episode, or None for other files."""
+        if file_info.get('type') != 'tv_show':
+            return None
+        return (file_info.get('title', '').lower(), file_info.get('season', 0), file_info.get('episode', 0))
+    
+    @staticmethod
+    def _phash_distance(file1: Dict, file2: Dict) -> int:
+        """Hamming distance between two files' perceptual hashes (64 if either is missing)."""
+        phash1 = file1.get('phash')
+        phash2 = file2.get('phash')
+        if phash1 is None or phash2 is None:
+            return 64
+        return bin(phash1 ^ phash2).count('1')
+    
     def _calculate_quality_score(self, file_info: Dict) -> float:
         """Calculate a quality score based on multiple factors."""
         # Base score starts at 0
@@ -363,12 +645,12 @@ class VideoAnalyzer:
             comparison['bitrate_diff'] = "Unknown"
         
         # File size comparison
-        file_size = self._get_file_size(file_info['path'])
-        best_size = self._get_file_size(best_file['path'])
+        file_size = file_info['size']
+        best_size = best_file['size']
         if file_size > 0 and best_size > 0:
             size_ratio = file_size / best_size
             comparison['size_percent'] = int(size_ratio * 100)
-            comparison['size_diff'] = f"{humanize.naturalsize(file_size)} vs {humanize.naturalsize(best_size)}"
+            comparison['size_diff'] = f"{_natural_size(file_size)} vs {_natural_size(best_size)}"
             comparison['size_diff_value'] = best_size - file_size
         else:
             comparison['size_percent'] = 100
@@ -376,8 +658,8 @@ class VideoAnalyzer:
             comparison['size_diff_value'] = 0
         
         # Overall quality score comparison
-        file_score = self._calculate_quality_score(file_info)
-        best_score = self._calculate_quality_score(best_file)
+        file_score = file_info['quality_score']
+        best_score = best_file['quality_score']
         if file_score > 0 and best_score > 0:
             quality_ratio = file_score / best_score
             comparison['quality_percent'] = int(quality_ratio * 100)
@@ -427,6 +709,15 @@ class VideoAnalyzer:
         if file1['path'] == file2['path']:
             return True
         
+        # Identical content signatures mean byte-identical copies
+        content_hash = file1.get('content_hash')
+        if content_hash and content_hash == file2.get('content_hash'):
+            return True
+        
+        # Near-identical pictures at near-identical lengths are re-encodes
+        if self._is_reencode(file1, file2):
+            return True
+        
         # For TV shows, match on title, season, and episode
         if file1.get('type') == 'tv_show' and file2.get('type') == 'tv_show':
             if (file1.get('title') == file2.get('title') and
@@ -504,27 +795,50 @@ class VideoAnalyzer:
     def auto_select_files(self, keep_highest_resolution: bool = True) -> None:
         """Automatically select files for deletion based on criteria."""
         self.selected_for_deletion.clear()
-        
-        # Process each duplicate group
-        for group_id, files in self.duplicates.items():
+        self.auto_select_many(self.duplicates.values(), keep_highest_resolution)
+    
+    def auto_select_many(self, groups: Iterable[List[Dict]], keep_highest_resolution: bool = True) -> None:
+        """Select all but one file of each duplicate group, leaving other selections alone.
+        
+        Args:
+            groups: Duplicate groups, each sorted highest quality first as in find_duplicates()
+            keep_highest_resolution: Keep the highest quality file, otherwise the smallest
+        """
+        paths = []
+        for files in groups:
             if len(files) <= 1:
                 continue
-                
+            
             if keep_highest_resolution:
-                # The files are already sorted with highest quality first from find_duplicates()
                 # Keep the highest resolution, mark others for deletion
-                for file_info in files[1:]:
-                    self.selected_for_deletion.add(file_info['path'])
+                keep = files[0]
             else:
-                # Sort by file size (smallest first)
-                sorted_files = sorted(
-                    files,
-                    key=lambda x: self._get_file_size(x['path'])
-                )
-                
                 # Keep the smallest file, mark others for deletion
-                for file_info in sorted_files[1:]:
-                    self.selected_for_deletion.add(file_info['path'])
+                keep = min(files, key=lambda x: x['size'])
+            paths.extend(file_info['path'] for file_info in files if file_info is not keep)
+        
+        self.selected_for_deletion.update(paths)
+    
+    def _remove_file(self, file_path: str) -> Tuple[str, int, Optional[str], Optional[str]]:
+        """Delete or move one file, returning (path, size, moved_to, error)."""
+        try:
+            size = self._get_file_size(file_path)
+            
+            if self.output_dir:
+                # Move to output directory instead of deleting
+                target_path = os.path.join(self.output_dir, os.path.basename(file_path))
+                os.rename(file_path, target_path)
+                logging.info(f"Moved: {file_path} -> {target_path}")
+                return file_path, size, target_path, None
+            
+            # Delete the file
+            os.remove(file_path)
+            logging.info(f"Deleted: {file_path}")
+            return file_path, size, None, None
+            
+        except Exception as e:
+            logging.error(f"Failed to delete {file_path}: {str(e)}")
+            return file_path, 0, None, str(e)
     
     def delete_selected_files(self) -> Dict[str, Any]:
         """Delete the files that have been selected for deletion."""
@@ -535,9 +849,12 @@ class VideoAnalyzer:
             'total_freed': 0
         }
         
+        # Report files in path order rather than set order
+        paths = sorted(self.selected_for_deletion)
+        
         if self.dry_run:
             logging.info("Dry run mode: No files will be deleted")
-            for file_path in self.selected_for_deletion:
+            for file_path in paths:
                 logging.info(f"Would delete: {file_path}")
                 size = self._get_file_size(file_path)
                 results['skipped'].append({
@@ -547,39 +864,36 @@ class VideoAnalyzer:
                 results['total_freed'] += size
             return results
             
-        for file_path in self.selected_for_deletion:
+        # Each removal waits on the filesystem, a round trip on network
+        # shares, so deletions run concurrently. Moves stay sequential so
+        # files sharing a name in the output directory resolve the same
+        # way every time.
+        workers = 1 if self.output_dir else min(DELETE_THREADS, len(paths))
+        
+        # Create the output directory once rather than for every file; if
+        # that fails, each move reports its own error below
+        if self.output_dir:
             try:
-                size = self._get_file_size(file_path)
-                
-                # Create output directory if specified
-                if self.output_dir:
-                    os.makedirs(self.output_dir, exist_ok=True)
-                    
-                    # Move to output directory instead of deleting
-                    target_path = os.path.join(self.output_dir, os.path.basename(file_path))
-                    os.rename(file_path, target_path)
-                    logging.info(f"Moved: {file_path} -> {target_path}")
-                    results['deleted'].append({
-                        'path': file_path,
-                        'size': size,
-                        'moved_to': target_path
-                    })
-                else:
-                    # Delete the file
-                    os.remove(file_path)
-                    logging.info(f"Deleted: {file_path}")
-                    results['deleted'].append({
+                os.makedirs(self.output_dir, exist_ok=True)
+            except OSError as e:
+                logging.error(f"Could not create output directory {self.output_dir}: {str(e)}")
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for file_path, size, target_path, error in executor.map(self._remove_file, paths):
+                if error is not None:
+                    results['failed'].append({
                         'path': file_path,
-                        'size': size
+                        'error': error
                     })
-                    
-                results['total_freed'] += size
+                    continue
                 
-            except Exception as e:
-                logging.error(f"Failed to delete {file_path}: {str(e)}")
-                results['failed'].append({
+                entry = {
                     'path': file_path,
-                    'error': str(e)
-                })
+                    'size': size
+                }
+                if target_path:
+                    entry['moved_to'] = target_path
+                results['deleted'].append(entry)
+                results['total_freed'] += size
                 
         return results 
\ No newline at end of file
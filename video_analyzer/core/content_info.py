@@ -2,15 +2,27 @@ import os
 import re
 from typing import Dict
 
+# Common patterns for TV shows: "Show.Name.S01E02" or "Show Name - S01E02"
+TV_PATTERN = re.compile(r'(.+?)[.\s-]+[Ss](\d+)[Ee](\d+)', re.IGNORECASE)
+
+# Release tags stripped from movie titles, applied in this order
+COMMON_TAGS = [
+    '1080p', '720p', '2160p', '4K', 'HDR', 'HEVC', 'x264', 'x265', 
+    'BluRay', 'WEB-DL', 'REMUX', 'AMZN', 'NF', 'DSNP', 'HULU'
+]
+TAG_PATTERNS = tuple(
+    re.compile(r'[.\s-]*' + tag + r'[.\s-]*', re.IGNORECASE) for tag in COMMON_TAGS
+)
+
+# Year in parentheses or brackets
+YEAR_PATTERN = re.compile(r'[\(\[\.\s-]*\d{4}[\)\]\.\s-]*')
+
 class ContentInfo:
     @staticmethod
     def extract_title_info(filename: str) -> Dict:
         """Extract TV show or movie title from filename."""
-        # Common patterns for TV shows: "Show.Name.S01E02" or "Show Name - S01E02"
-        tv_pattern = re.compile(r'(.+?)[.\s-]+[Ss](\d+)[Ee](\d+)', re.IGNORECASE)
-        
         # Try to match TV show pattern
-        tv_match = tv_pattern.search(filename)
+        tv_match = TV_PATTERN.search(filename)
         if tv_match:
             show_name = tv_match.group(1).replace('.', ' ').strip()
             season = int(tv_match.group(2))
@@ -25,23 +37,13 @@ class ContentInfo:
         # If not a TV show, assume it's a movie
         # Remove file extension and common tags
         clean_name = os.path.splitext(filename)[0]
-        common_tags = [
-            '1080p', '720p', '2160p', '4K', 'HDR', 'HEVC', 'x264', 'x265', 
-            'BluRay', 'WEB-DL', 'REMUX', 'AMZN', 'NF', 'DSNP', 'HULU'
-        ]
-        
-        for tag in common_tags:
-            clean_name = re.sub(
-                r'[.\s-]*' + tag + r'[.\s-]*',
-                ' ',
-                clean_name,
-                flags=re.IGNORECASE
-            )
+        for tag_pattern in TAG_PATTERNS:
+            clean_name = tag_pattern.sub(' ', clean_name)
         
         # Remove year in parentheses or brackets
-        clean_name = re.sub(r'[\(\[\.\s-]*\d{4}[\)\]\.\s-]*', ' ', clean_name)
+        clean_name = YEAR_PATTERN.sub(' ', clean_name)
         
         return {
             'type': 'movie',
             'title': clean_name.replace('.', ' ').strip()
-        } 
\ No newline at end of file
+        }
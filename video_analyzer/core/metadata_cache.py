@@ -0,0 +1,88 @@
+import os
+import json
+import sqlite3
+import logging
+from typing import Dict, Iterable, Optional, Tuple
+
+from ..version import __version__
+
+# Default location of the persistent metadata cache
+METADATA_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "video_analyzer", "metadata.db")
+
+# Layout of the metadata VideoAnalyzer.extract_file_metadata returns. Bump it
+# whenever that output changes, so entries stored without the new fields are
+# probed again instead of being served.
+METADATA_FORMAT = 2
+
+# Stored with each entry; only entries with the current value are served
+ENTRY_VERSION = f"{__version__}/{METADATA_FORMAT}"
+
+class MetadataCache:
+    """Persistent cache of extracted file metadata, backed by SQLite.
+
+    Entries are keyed by path and only returned while the file's
+    modification time and size are unchanged, so a re-run only probes
+    files that are new or have been modified. Entries written by another
+    version of the application or for another METADATA_FORMAT are
+    ignored, since the metadata they hold may be parsed differently or
+    lack fields.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or METADATA_CACHE_PATH
+        self._conn = None
+        try:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+                "version TEXT, json TEXT)"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Metadata cache unavailable, files will be probed: {str(e)}")
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get(self, file_path: str, mtime_ns: int, size: int) -> Optional[Dict]:
+        """Return cached metadata for a file, or None if missing or stale."""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT json FROM metadata WHERE path=? AND mtime_ns=? AND size=? AND version=?",
+                (file_path, mtime_ns, size, ENTRY_VERSION)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logging.warning(f"Could not read metadata cache: {str(e)}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def put_many(self, entries: Iterable[Tuple[str, int, int, Dict]]) -> None:
+        """Store (path, mtime_ns, size, metadata) entries in one transaction."""
+        if self._conn is None:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO metadata (path, mtime_ns, size, version, json) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((path, mtime_ns, size, ENTRY_VERSION, json.dumps(metadata))
+                     for path, mtime_ns, size, metadata in entries)
+                )
+        except sqlite3.Error as e:
+            logging.warning(f"Could not update metadata cache: {str(e)}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,14 +1,47 @@
 import os
+import stat
 import subprocess
-import json
+import math
+import hashlib
 from typing import Dict, Optional
 import logging
 import shutil
 from concurrent.futures import ThreadPoolExecutor
 
+# orjson parses ffprobe output several times faster when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Side of the grayscale thumbnail a perceptual hash is computed from
+PHASH_IMAGE_SIZE = 32
+# Side of the block of low-frequency DCT coefficients kept for the hash
+PHASH_HASH_SIZE = 8
+# Frames whose gray levels span less than this are not hashed; black or
+# faded frames would otherwise give unrelated videos matching hashes
+PHASH_MIN_CONTRAST = 16
+# DCT-II basis for the kept frequencies: _PHASH_COS[u][x] = cos((2x + 1)uπ / 2N)
+_PHASH_COS = [
+    [math.cos((2 * x + 1) * u * math.pi / (2 * PHASH_IMAGE_SIZE)) for x in range(PHASH_IMAGE_SIZE)]
+    for u in range(PHASH_HASH_SIZE)
+]
+
 class VideoMetadata:
     # Cache for checking if ffprobe exists - avoid repeated checks
     _ffprobe_path = None
+    # Same for ffmpeg, which is optional; '' records that it is missing
+    _ffmpeg_path = None
+    
+    # Only ask ffprobe for the fields we read, so each probe emits and
+    # we parse a small JSON document instead of every stream and tag
+    FFPROBE_ENTRIES = (
+        'format=format_name,bit_rate,duration:'
+        'stream=codec_type,codec_name,width,height,r_frame_rate'
+    )
+    
+    # Bytes hashed from each end of a file for its content signature
+    SIGNATURE_CHUNK_SIZE = 1024 * 1024
     
     @classmethod
     def _get_ffprobe_path(cls):
@@ -17,12 +50,23 @@ class VideoMetadata:
             cls._ffprobe_path = shutil.which('ffprobe')
         return cls._ffprobe_path
     
+    @classmethod
+    def _get_ffmpeg_path(cls):
+        """Get the path to ffmpeg executable, with caching."""
+        if cls._ffmpeg_path is None:
+            cls._ffmpeg_path = shutil.which('ffmpeg') or ''
+        return cls._ffmpeg_path
+    
     @staticmethod
     def get_video_metadata(file_path: str) -> Optional[Dict]:
         """Extract resolution, bitrate, and format info using ffprobe."""
         try:
-            # Check if file exists
-            if not os.path.isfile(file_path):
+            # Check if file exists; the same stat provides the size below
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                file_stat = None
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
                 logging.error(f"File does not exist: {file_path}")
                 return None
                 
@@ -36,23 +80,24 @@ class VideoMetadata:
                 ffprobe_path, 
                 '-v', 'quiet', 
                 '-print_format', 'json', 
-                '-show_format', 
-                '-show_streams', 
+                '-select_streams', 'v:0',
+                '-show_entries', VideoMetadata.FFPROBE_ENTRIES,
                 file_path
             ]
             
-            # Add a timeout of 30 seconds
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            # Add a timeout of 30 seconds. Output is kept as bytes, which
+            # both JSON parsers accept without a separate decode step.
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
             if result.returncode != 0:
                 logging.error(f"ffprobe failed with return code {result.returncode}")
                 if result.stderr:
-                    logging.error(f"Error output: {result.stderr}")
+                    logging.error(f"Error output: {result.stderr.decode(errors='replace')}")
                 return None
                 
-            # Parse JSON output
+            # Parse JSON output; both parsers raise a ValueError subclass
             try:
-                data = json.loads(result.stdout)
-            except json.JSONDecodeError:
+                data = json_loads(result.stdout)
+            except ValueError:
                 logging.error(f"Failed to parse ffprobe output for {file_path}")
                 return None
             
@@ -87,7 +132,7 @@ class VideoMetadata:
                 bitrate_value = 0
             
             # Get file size in MB
-            file_size_bytes = os.path.getsize(file_path)
+            file_size_bytes = file_stat.st_size
             file_size_mb = round(file_size_bytes / (1024 * 1024), 2)
             
             # Get duration
@@ -138,6 +183,80 @@ class VideoMetadata:
             logging.error(f"Error processing {file_path}: {str(e)}")
             return None
     
+    @staticmethod
+    def compute_signature(file_path: str) -> Optional[str]:
+        """Hash a file's size and the chunks at its start and end.
+        
+        Byte-identical copies always share a signature, so matching
+        signatures identify true duplicates without comparing metadata.
+        Only the ends are read to keep hashing cheap on large files.
+        """
+        chunk_size = VideoMetadata.SIGNATURE_CHUNK_SIZE
+        try:
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+                digest.update(f.read(chunk_size))
+                if size > chunk_size:
+                    f.seek(max(chunk_size, size - chunk_size))
+                    digest.update(f.read(chunk_size))
+        except OSError as e:
+            logging.warning(f"Could not compute signature of {file_path}: {str(e)}")
+            return None
+        return digest.hexdigest()
+    
+    @staticmethod
+    def compute_perceptual_hash(file_path: str, duration: float = 0) -> Optional[int]:
+        """Compute a 64-bit perceptual hash (pHash) of a frame of the video.
+        
+        The frame is taken a tenth of the way in, past any black intro,
+        and scaled down to a grayscale thumbnail whose low-frequency DCT
+        coefficients are compared against their median. Re-encodes of the
+        same video give hashes a small Hamming distance apart.
+        """
+        ffmpeg_path = VideoMetadata._get_ffmpeg_path()
+        if not ffmpeg_path:
+            return None
+        
+        size = PHASH_IMAGE_SIZE
+        cmd = [
+            ffmpeg_path,
+            '-v', 'quiet',
+            '-ss', f"{duration * 0.1:.3f}",
+            '-i', file_path,
+            '-frames:v', '1',
+            '-vf', f"scale={size}:{size},format=gray",
+            '-f', 'rawvideo',
+            '-'
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logging.warning(f"Could not extract a frame from {file_path}: {str(e)}")
+            return None
+        pixels = result.stdout
+        if result.returncode != 0 or len(pixels) < size * size:
+            logging.warning(f"Could not extract a frame from {file_path}")
+            return None
+        if max(pixels) - min(pixels) < PHASH_MIN_CONTRAST:
+            return None
+        
+        # Separable 2D DCT, computing only the kept low frequencies
+        rows = [pixels[y * size:(y + 1) * size] for y in range(size)]
+        row_dct = [[sum(c * p for c, p in zip(basis, row)) for basis in _PHASH_COS] for row in rows]
+        coefficients = [
+            sum(basis[y] * row_dct[y][u] for y in range(size))
+            for basis in _PHASH_COS
+            for u in range(PHASH_HASH_SIZE)
+        ]
+        
+        # The DC term only reflects overall brightness, so leave it out of the median
+        median = sorted(coefficients[1:])[len(coefficients[1:]) // 2]
+        phash = 0
+        for coefficient in coefficients:
+            phash = (phash << 1) | (coefficient > median)
+        return phash
+    
     @staticmethod
     def batch_process_files(file_paths, max_workers=None):
         """Process multiple files in parallel using ThreadPoolExecutor."""
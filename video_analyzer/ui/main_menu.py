@@ -6,7 +6,7 @@ from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
-from ..utils.display import DisplayManager
+from ..utils.display import DisplayManager, DisplayUtils
 from ..core.analyzer import VideoAnalyzer
 from typing import Dict, List, Set
 
@@ -34,48 +34,49 @@ class Menu:
                 self.console.print("[red]Please enter a number.[/red]")
 
 class MainMenu:
-    def __init__(self, analyzer: VideoAnalyzer):
+    def __init__(self, analyzer: VideoAnalyzer, display: DisplayManager = None):
         self.analyzer = analyzer
-        self.display = DisplayManager()
-        self.console = Console()
+        self.display = display or DisplayManager()
+        self.console = self.display.console
     
     def show_menu(self):
         """Display the main menu with enhanced options."""
         while True:
-            self.console.clear()
-            self.console.print("[bold cyan]Video Analyzer Menu[/bold cyan]")
-            self.console.print()
+            # Buffer the screen so it is written in one go
+            with self.console:
+                self.console.clear()
+                self.console.print("[bold cyan]Video Analyzer Menu[/bold cyan]")
+                self.console.print()
             
-            # Show summary of analyzed content if available
-            if self.analyzer.duplicates:
-                tv_shows = sum(1 for name in self.analyzer.duplicates if ' - S' in name)
-                movies = len(self.analyzer.duplicates) - tv_shows
+                # Show summary of analyzed content if available
+                if self.analyzer.duplicates:
+                    tv_shows = sum(1 for name in self.analyzer.duplicates if ' - S' in name)
+                    movies = len(self.analyzer.duplicates) - tv_shows
                 
-                total_duplicate_files = sum(len(files) for files in self.analyzer.duplicates.values())
-                total_files_for_deletion = len(self.analyzer.selected_for_deletion)
+                    total_files_for_deletion = len(self.analyzer.selected_for_deletion)
                 
-                self.console.print(f"[green]Found {len(self.analyzer.duplicates)} duplicate groups[/green]")
-                self.console.print(f"  • [yellow]{tv_shows} TV Show episodes[/yellow]")
-                self.console.print(f"  • [yellow]{movies} Movies[/yellow]")
-                self.console.print(f"[green]Selected {total_files_for_deletion} files for removal[/green]")
-                self.console.print()
+                    self.console.print(f"[green]Found {len(self.analyzer.duplicates)} duplicate groups[/green]")
+                    self.console.print(f"  • [yellow]{tv_shows} TV Show episodes[/yellow]")
+                    self.console.print(f"  • [yellow]{movies} Movies[/yellow]")
+                    self.console.print(f"[green]Selected {total_files_for_deletion} files for removal[/green]")
+                    self.console.print()
             
-            menu_items = [
-                ("1", "View Duplicate Groups"),
-                ("2", "Auto-Select Lower Quality Files"),
-                ("3", "View Storage Analysis Chart"),
-                ("4", "View Duplicates Distribution"),
-                ("5", "Review Selected Files"),
-                ("6", "Execute Deletion"),
-                ("7", "Filter by Resolution"),
-                ("8", "Check for Updates"),
-                ("q", "Quit")
-            ]
+                menu_items = [
+                    ("1", "View Duplicate Groups"),
+                    ("2", "Auto-Select Lower Quality Files"),
+                    ("3", "View Storage Analysis Chart"),
+                    ("4", "View Duplicates Distribution"),
+                    ("5", "Review Selected Files"),
+                    ("6", "Execute Deletion"),
+                    ("7", "Filter by Resolution"),
+                    ("8", "Check for Updates"),
+                    ("q", "Quit")
+                ]
             
-            for key, desc in menu_items:
-                self.console.print(f"[yellow]{key}[/yellow]: {desc}")
+                for key, desc in menu_items:
+                    self.console.print(f"[yellow]{key}[/yellow]: {desc}")
             
-            choice = input("\nEnter your choice: ").lower()
+            choice = DisplayUtils.read_key("\nEnter your choice: ").lower()
             
             if choice == '1':
                 self._show_duplicate_groups()
@@ -143,6 +144,7 @@ class MainMenu:
     
     def _display_group_list(self, groups, title):
         """Display a list of duplicate groups with details."""
+        group_names = list(groups)
         while True:
             self.console.clear()
             self.console.print(f"[bold cyan]{title}[/bold cyan] ({len(groups)} groups)\n")
@@ -157,13 +159,14 @@ class MainMenu:
             
             # Add rows for each group
             for i, (group_name, files) in enumerate(groups.items(), 1):
-                # Get unique resolutions in the group
-                resolutions = set(file.get('resolution_category', 'Unknown') for file in files)
+                # Get unique resolutions and total size in one pass over the group
+                resolutions = set()
+                total_size = 0
+                for file in files:
+                    resolutions.add(file.get('resolution_category', 'Unknown'))
+                    total_size += file['size']
                 resolutions_str = ", ".join(sorted(resolutions))
                 
-                # Calculate total size
-                total_size = sum(self.analyzer._get_file_size(file['path']) for file in files)
-                
                 table.add_row(
                     str(i),
                     group_name,
@@ -183,7 +186,7 @@ class MainMenu:
             try:
                 group_idx = int(selection) - 1
                 if 0 <= group_idx < len(groups):
-                    group_name = list(groups.keys())[group_idx]
+                    group_name = group_names[group_idx]
                     self._display_group_details(group_name, groups[group_name])
                 else:
                     self.console.print("[red]Invalid group number. Please try again.[/red]")
@@ -210,7 +213,7 @@ class MainMenu:
             highest_quality = files[0]  # First file should be highest quality from sort
             
             highest_info = Panel(
-                f"[bold]Highest Quality Version:[/bold] {os.path.basename(highest_quality['path'])}\n"
+                f"[bold]Highest Quality Version:[/bold] {highest_quality['filename']}\n"
                 f"[bold]Resolution:[/bold] {highest_quality.get('resolution', 'Unknown')}\n"
                 f"[bold]Bitrate:[/bold] {highest_quality.get('bitrate', 'Unknown')}\n"
                 f"[bold]Codec:[/bold] {highest_quality.get('codec', 'Unknown')}\n"
@@ -228,7 +231,7 @@ class MainMenu:
             self.console.print("  3. Toggle all except highest quality")
             self.console.print("  4. Back to group list")
             
-            choice = input("\nEnter choice: ")
+            choice = DisplayUtils.read_key("\nEnter choice: ")
             
             if choice == '1':
                 self._select_files_to_keep(files)
@@ -256,15 +259,13 @@ class MainMenu:
                 quality_percent = comparison.get('quality_percent', 100)
                 quality_info = f" [yellow]({quality_percent}% of best quality)[/yellow]"
             
-            self.console.print(f"{i}. {os.path.basename(file['path'])} - {resolution}{quality_info}")
+            self.console.print(f"{i}. {file['filename']} - {resolution}{quality_info}")
         
         selection = input("\nEnter numbers of files to KEEP (comma-separated, or 'a' for all, 'h' for highest only): ")
         
         if selection.lower() == 'a':
             # Keep all files (remove all from selection)
-            for file in files:
-                if file['path'] in self.analyzer.selected_for_deletion:
-                    self.analyzer.selected_for_deletion.remove(file['path'])
+            self.analyzer.selected_for_deletion.difference_update(file['path'] for file in files)
         elif selection.lower() == 'h':
             # Keep only highest quality
             self._toggle_all_except_highest(files)
@@ -274,17 +275,17 @@ class MainMenu:
                 keep_indices = [int(idx.strip()) - 1 for idx in selection.split(',') if idx.strip()]
                 
                 # Verify indices
-                valid_indices = [idx for idx in keep_indices if 0 <= idx < len(files)]
+                valid_indices = {idx for idx in keep_indices if 0 <= idx < len(files)}
                 
                 # Update selection
+                selected_for_deletion = self.analyzer.selected_for_deletion
                 for i, file in enumerate(files):
                     if i in valid_indices:
                         # Remove from deletion selection if present
-                        if file['path'] in self.analyzer.selected_for_deletion:
-                            self.analyzer.selected_for_deletion.remove(file['path'])
+                        selected_for_deletion.discard(file['path'])
                     else:
                         # Add to deletion selection
-                        self.analyzer.selected_for_deletion.add(file['path'])
+                        selected_for_deletion.add(file['path'])
                         
             except ValueError:
                 self.console.print("[red]Invalid input. Please enter comma-separated numbers.[/red]")
@@ -307,7 +308,7 @@ class MainMenu:
                 quality_percent = comparison.get('quality_percent', 100)
                 quality_info = f" [yellow]({quality_percent}% of best quality)[/yellow]"
             
-            self.console.print(f"{i}. {os.path.basename(file['path'])} - {resolution}{quality_info}")
+            self.console.print(f"{i}. {file['filename']} - {resolution}{quality_info}")
         
         selection = input("\nEnter numbers of files to DELETE (comma-separated, or 'a' for all except highest): ")
         
@@ -320,17 +321,17 @@ class MainMenu:
                 delete_indices = [int(idx.strip()) - 1 for idx in selection.split(',') if idx.strip()]
                 
                 # Verify indices
-                valid_indices = [idx for idx in delete_indices if 0 <= idx < len(files)]
+                valid_indices = {idx for idx in delete_indices if 0 <= idx < len(files)}
                 
                 # Update selection
+                selected_for_deletion = self.analyzer.selected_for_deletion
                 for i, file in enumerate(files):
                     if i in valid_indices:
                         # Add to deletion selection
-                        self.analyzer.selected_for_deletion.add(file['path'])
+                        selected_for_deletion.add(file['path'])
                     else:
                         # Remove from deletion selection if present
-                        if file['path'] in self.analyzer.selected_for_deletion:
-                            self.analyzer.selected_for_deletion.remove(file['path'])
+                        selected_for_deletion.discard(file['path'])
                         
             except ValueError:
                 self.console.print("[red]Invalid input. Please enter comma-separated numbers.[/red]")
@@ -345,12 +346,10 @@ class MainMenu:
         highest_quality = files[0]
         
         # Remove highest quality from deletion
-        if highest_quality['path'] in self.analyzer.selected_for_deletion:
-            self.analyzer.selected_for_deletion.remove(highest_quality['path'])
+        self.analyzer.selected_for_deletion.discard(highest_quality['path'])
         
         # Add all others to deletion
-        for file in files[1:]:
-            self.analyzer.selected_for_deletion.add(file['path'])
+        self.analyzer.selected_for_deletion.update(file['path'] for file in files[1:])
     
     def _auto_select_files(self):
         """Auto-select files for deletion based on resolution and quality."""
@@ -367,7 +366,7 @@ class MainMenu:
         self.console.print("3. Smart selection (balanced quality/size)")
         self.console.print("4. Cancel")
         
-        choice = input("\nEnter choice: ")
+        choice = DisplayUtils.read_key("\nEnter choice: ")
         
         if choice == '1':
             self.analyzer.auto_select_files(keep_highest_resolution=True)
@@ -408,7 +407,7 @@ class MainMenu:
                     
                     # If quality is >90% of best but file is >20% smaller, consider keeping it
                     if quality_percent > 90 and size_diff_value > 0 and \
-                       (size_diff_value / self.analyzer._get_file_size(highest_quality['path'])) > 0.2:
+                       (size_diff_value / highest_quality['size']) > 0.2:
                         # Keep this file, possibly mark highest for deletion if it's not much better
                         if quality_percent > 95:  # Very close in quality
                             self.analyzer.selected_for_deletion.add(highest_quality['path'])
@@ -428,15 +427,14 @@ class MainMenu:
             return
         
         # Calculate storage metrics
-        total_size = sum(
-            sum(self.analyzer._get_file_size(file['path']) for file in files)
-            for files in self.analyzer.duplicates.values()
-        )
-        
-        duplicate_size = sum(
-            sum(self.analyzer._get_file_size(file['path']) for file in files[1:])
-            for files in self.analyzer.duplicates.values()
-        )
+        total_size = 0
+        duplicate_size = 0
+        for files in self.analyzer.duplicates.values():
+            group_size = sum(file['size'] for file in files)
+            total_size += group_size
+            if files:
+                # Everything except the highest quality copy counts as duplicate
+                duplicate_size += group_size - files[0]['size']
         
         selected_size = sum(
             self.analyzer._get_file_size(path)
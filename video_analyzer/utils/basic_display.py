@@ -25,9 +25,13 @@ class DisplayManager:
     GRAPH_WIDTH = 60
     GRAPH_HEIGHT = 15
     
-    def __init__(self):
-        """Initialize the display manager with default values."""
-        self.console = Console()
+    def __init__(self, console=None):
+        """Initialize the display manager with default values.
+        
+        Args:
+            console: Rich Console instance to reuse for output
+        """
+        self.console = console or Console()
         self.total_files = 0
         self.processed_files = 0
         self.processing_log = []
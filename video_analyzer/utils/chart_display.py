@@ -1,5 +1,4 @@
 import os
-import plotext as plt
 import humanize
 from collections import defaultdict
 from typing import Dict
@@ -17,6 +16,10 @@ class ChartDisplayMixin:
         self.total_size = total_size
         self.potential_savings = selected_size
         
+        # plotext takes longer to import than the rest of the application,
+        # so it is only loaded once a chart is actually drawn
+        import plotext as plt
+        
         # Set up the plot
         plt.clf()
         plt.title("Storage Analysis")
@@ -96,6 +99,8 @@ class ChartDisplayMixin:
                 category = self._get_size_category(size * 1024 * 1024)  # Convert MB to bytes
                 file_sizes[category] += 1
         
+        import plotext as plt
+        
         # Plot 1: Group Size Distribution
         plt.clf()
         plt.plotsize(GRAPH_WIDTH, GRAPH_HEIGHT)
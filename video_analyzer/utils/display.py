@@ -3,7 +3,6 @@ from typing import Dict, List, Optional
 from colorama import Fore, Style, Back
 import os
 import humanize
-import plotext as plt
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
@@ -1,8 +1,15 @@
 import time
 import os
+import sys
 from typing import Dict
 from colorama import Fore, Style, Back
 
+if os.name == 'nt':
+    import msvcrt
+
+# Terminal sequence that clears the screen and scrollback
+CLEAR_SCREEN_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
 class DisplayUtils:
     @staticmethod
     def print_status(message: str, color: str = Fore.BLUE) -> None:
@@ -53,10 +60,48 @@ class DisplayUtils:
             f"{file_info['filename']}"
         ]
     
+    @staticmethod
+    def read_key(prompt: str = "") -> str:
+        """Read a single keypress without waiting for Enter.
+        
+        Falls back to reading a whole line when stdin is not a terminal,
+        or when termios is unavailable (the Linux release binary leaves it out).
+        """
+        if not sys.stdin.isatty():
+            return input(prompt)
+        
+        if os.name == 'nt':
+            print(prompt, end="", flush=True)
+            key = msvcrt.getwch()
+            if key == '\x03':
+                raise KeyboardInterrupt
+        else:
+            try:
+                import termios
+                import tty
+            except ImportError:
+                return input(prompt)
+            
+            print(prompt, end="", flush=True)
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            try:
+                tty.setcbreak(fd)
+                key = sys.stdin.read(1)
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        print(key)
+        return key
+    
     @staticmethod
     def clear_screen() -> None:
-        """Clear the terminal screen in a cross-platform way."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen.
+        
+        Uses ANSI sequences, which colorama enables on Windows consoles,
+        rather than spawning cls/clear.
+        """
+        sys.stdout.write(CLEAR_SCREEN_SEQUENCE)
+        sys.stdout.flush()
     
     @staticmethod
     def format_quality_comparison(file_info: Dict) -> str:
@@ -1,3 +1,4 @@
+import os
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.console import Console
 from typing import Dict, List, Optional
@@ -30,11 +31,12 @@ class ProgressDisplayMixin:
         """Add a file to the processing log with timestamp and keep a scrollable history."""
         self.processed_files += 1
         timestamp = datetime.now().strftime("%H:%M:%S")
+        basename = os.path.basename(filename)
         
         # Add to the processing log
         self.processing_log.append({
             'timestamp': timestamp,
-            'filename': self._get_basename(filename),
+            'filename': basename,
             'path': filename
         })
         
@@ -43,10 +45,10 @@ class ProgressDisplayMixin:
             self.processing_log = self.processing_log[-self.MAX_LOG_LINES:]
             
         # Update the current file
-        self.current_file = self._get_basename(filename)
+        self.current_file = basename
         
         # Update file type statistics if available
-        extension = self._get_extension(filename).lower()
+        extension = os.path.splitext(basename)[1].lower()
         if extension:
             self.file_types[extension] += 1
     
@@ -117,13 +119,4 @@ class ProgressDisplayMixin:
             border_style="blue",
             padding=(1, 2)
         )
-    
-    def _get_basename(self, path: str) -> str:
-        """Extract the filename from a path."""
-        import os
-        return os.path.basename(path)
-    
-    def _get_extension(self, path: str) -> str:
-        """Extract the file extension from a path."""
-        import os
-        return os.path.splitext(path)[1] 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -2,7 +2,6 @@ import os
 import humanize
 from typing import Dict, List, Set, Optional
 from collections import defaultdict
-import plotext as plt
 from rich.table import Table
 from rich import box
 from rich.text import Text
@@ -62,7 +61,7 @@ class TableDisplayMixin:
                 file_info.get('codec', 'Unknown'),
                 file_info.get('file_size', 'Unknown'),
                 quality_indicator,
-                os.path.basename(file_info['path'])
+                file_info['filename']
             )
             
             # Add comparison details in a separate row if not the highest quality
@@ -122,6 +121,9 @@ class TableDisplayMixin:
         table.add_row("Files to Delete", str(len(files_to_delete)))
         table.add_row("Total Space to Free", humanize.naturalsize(total_size))
         
+        # Loaded here rather than at import time; see plot_storage_chart
+        import plotext as plt
+        
         # Generate resolution distribution chart
         if resolution_groups:
             plt.clf()